@@ -107,11 +107,13 @@ class DiGraph(ar.Graph):
         src = input_src
         dst = input_dst
 
-        # 1a. Initialize the weights array, if applicable.
-        wgt = ak.array([1.0])
+        # 1a. Initialize the weights array, if applicable. Unweighted graphs get a one element
+        #     placeholder.
         if isinstance(input_weight,pdarray):
             wgt = input_weight
             self.weighted = 1
+        else:
+            wgt = ak.array([1.0])
 
         # 2. Sort the edges and remove duplicates.
         gb_edges = ak.GroupBy([src,dst])
@@ -170,10 +172,10 @@ class DiGraph(ar.Graph):
         neis_reversed = ak.full(gb_vertices.unique_keys.size, 0, dtype=ak.int64)
         neis_reversed[gb_src_indices_reversed] = gb_src_neighbors_reversed
 
-        # 3. Run a prefix (cumulative) sum on neis to get the starting indices for each vertex.
+        # 3. Run a prefix (cumulative) sum on neis to get the starting indices for each vertex. The
+        #    leading zero created for the regular segments is reused.
         segs_reversed = ak.cumsum(neis_reversed)
-        first_seg_reversed = ak.array([0])
-        segs_reversed = ak.concatenate([first_seg_reversed, segs_reversed])
+        segs_reversed = ak.concatenate([first_seg, segs_reversed])
 
         ### Store everything in a graph object in the Chapel server.
         # 1. Store data into an Graph object in the Chapel server.
@@ -183,11 +183,13 @@ class Graph:
         src = ak.concatenate([input_src, input_dst])
         dst = ak.concatenate([input_dst, input_src])
 
-        # 1a. Initialize and symmetrize the weights of each edge, if applicable.
-        wgt = ak.array([1.0])
+        # 1a. Initialize and symmetrize the weights of each edge, if applicable. Unweighted graphs
+        #     get a one element placeholder.
         if isinstance(input_weight, pdarray):
             wgt = ak.concatenate([input_weight, input_weight])
             self.weighted = 1
+        else:
+            wgt = ak.array([1.0])
 
         # 2. Sort the edges and remove duplicates.
         gb_edges = ak.GroupBy([src, dst])
@@ -8,16 +8,151 @@ import string
 import arachne as ar
 import arkouda as ak
 
-__all__ = ["PropGraph", "no_filter"]
+__all__ = ["PropGraph", "AttributeView", "no_filter"]
 
 def generate_string(n=5):
     """Generate random digit strings of the size of parameter `n`."""
     return ''.join(random.choices(string.digits, k=n))
 
+def _prepare_attribute_columns(attributes: Dict,
+                               convert_strings_to_categoricals: bool
+                              ) -> Tuple[Dict, List[str], List[str]]:
+    """Prepares label, relationship or property columns to be sent to the back-end. The type of
+    every column is resolved in a single pass, `Strings` columns are converted to `Categorical` if
+    requested and every `Categorical` is registered.
+
+    Parameters
+    ----------
+    attributes : Dict
+        Dictionary mapping column names to `ak.pdarray`, `ak.Strings` or `ak.Categorical`.
+    convert_strings_to_categoricals : bool
+        If True, `Strings` columns are converted to `Categorical`.
+
+    Returns
+    -------
+    (Dict, List(str), List(str))
+        The columns to store, and the symbol table ids and object types of each column.
+    """
+    num_columns = len(attributes)
+    object_types = [None] * num_columns
+    symbol_table_ids = [None] * num_columns
+    for i, values in enumerate(attributes.values()):
+        if isinstance(values, ak.Strings):
+            object_types[i] = "Categorical" if convert_strings_to_categoricals else "Strings"
+        elif isinstance(values, ak.Categorical):
+            object_types[i] = "Categorical"
+        elif isinstance(values, ak.pdarray):
+            object_types[i] = "pdarray"
+        else:
+            raise NotImplementedError(f"{type(values)} not supported by property graph")
+
+    columns = dict(attributes)
+    for i, (col, values) in enumerate(attributes.items()):
+        if object_types[i] == "Categorical":
+            if isinstance(values, ak.Strings):
+                values = ak.Categorical(values)
+                columns[col] = values
+            values.register(generate_string())
+            symbol_table_ids[i] = values.registered_name
+        else:
+            symbol_table_ids[i] = values.name
+
+    return (columns, symbol_table_ids, object_types)
+
+def _column_names(columns: Union[Dict, ak.DataFrame]) -> List[str]:
+    """Returns the column names of a dictionary of columns or of an `ak.DataFrame`."""
+    return list(columns.columns) if isinstance(columns, ak.DataFrame) else list(columns)
+
+def _check_column_sizes(columns: Union[Dict, ak.DataFrame], new_columns: Dict) -> None:
+    """Raises a `ValueError` if the columns in `new_columns` do not all have the same size as the
+    columns in `columns`, a dictionary of columns or an `ak.DataFrame`, before any of them are
+    sent to the back-end."""
+    sizes = {values.size for values in new_columns.values()}
+    names = _column_names(columns)
+    if names:
+        sizes.add(columns[names[0]].size)
+    if len(sizes) > 1:
+        raise ValueError(f"attribute columns must all have the same size, found {sorted(sizes)}")
+
+def _first_found_rows(indices: ak.pdarray) -> Tuple[ak.pdarray, ak.pdarray]:
+    """Given internal vertex or edge indices where -1 marks vertices or edges that do not exist in
+    the graph, returns the row of the first occurrence of each existing index in sorted order and
+    the indices of those rows. Gathering with the returned rows sorts, deduplicates and filters in
+    one pass."""
+    gb_indices = ak.GroupBy(indices)
+    found = gb_indices.unique_keys >= 0
+    inds = gb_indices.permutation[gb_indices.segments]
+    return (inds[found], gb_indices.unique_keys[found])
+
+def _in1d_pair(a0: ak.pdarray,
+               a1: ak.pdarray,
+               b: ak.pdarray) -> Tuple[ak.pdarray, ak.pdarray]:
+    """Tests membership of the elements of both `a0` and `a1` in `b` with a single `ak.in1d` call
+    so `b` is only processed once."""
+    in_b = ak.in1d(ak.concatenate([a0, a1]), b)
+    return (in_b[0:a0.size], in_b[a0.size:])
+
 def no_filter(attributes: ak.DataFrame):
     """Default filtering method for property subgraph view generation."""
     return ak.full(attributes.shape[0], True, ak.akbool)
 
+class AttributeView:
+    """Read-only view over a subset of the columns of an attribute dataframe, returned by
+    `PropGraph.get_node_labels` and `PropGraph.get_edge_relationships`. Columns are fetched from
+    the underlying dataframe on access instead of being copied into a new dataframe.
+
+    >>> labels = G.get_node_labels()
+    >>> labels["label1"]
+    >>> labels[["nodes", "label1"]]
+    >>> labels.to_dataframe()
+
+    Attributes
+    ----------
+    columns : List(str)
+        Names of the columns visible through the view.
+    """
+
+    def __init__(self, attributes: ak.DataFrame, columns: List[str]) -> None:
+        """Initializes a view over `columns` of `attributes`."""
+        self._attributes = attributes
+        self.columns = columns
+
+    def __getitem__(self, key: Union[str, List[str]]):
+        """Returns the column `key`, or the dataframe of the columns in the list `key`, of the
+        underlying dataframe.
+
+        Raises
+        ------
+        KeyError
+            If a requested column is not part of the view.
+        TypeError
+            If `key` is not a column name or a list of column names.
+        """
+        if isinstance(key, str):
+            if key not in self.columns:
+                raise KeyError(f"{key} is not a column of this view")
+            return self._attributes[key]
+        if isinstance(key, list) and all(isinstance(col, str) for col in key):
+            columns = set(self.columns)
+            missing_columns = [col for col in key if col not in columns]
+            if missing_columns:
+                raise KeyError(f"{missing_columns} are not columns of this view")
+            return self._attributes[key]
+        raise TypeError(f"{type(key)} is not supported, columns are selected by name or by a "
+                        f"list of names")
+
+    def __len__(self) -> int:
+        """Returns the number of rows of the underlying dataframe."""
+        return len(self._attributes)
+
+    def to_dataframe(self) -> ak.DataFrame:
+        """Materializes the view into a new `ak.DataFrame`."""
+        return self._attributes[self.columns]
+
+    def to_pandas(self):
+        """Materializes the view into a `pandas.DataFrame`."""
+        return self.to_dataframe().to_pandas()
+
 class PropGraph(ar.DiGraph):
     """`PropGraph` is the base class to represent a property graph. It inherits from `DiGraph` since
     all property graphs are composed of directed edges. Property graphs contain vertices (nodes) and
@@ -90,12 +225,133 @@ class PropGraph(ar.DiGraph):
         super().__init__()
         self.multied = 0
         self.edge_names = ()
-        self.edge_attributes = ak.DataFrame()
+        self._edge_attributes = {}
         self.relationship_columns = []
         self.node_name = ()
-        self.node_attributes = ak.DataFrame()
+        self._node_attributes = {}
+        self.label_columns = []
+        self._nodes_cache = None
+        self._edges_cache = None
+        self._internal_edges_cache = None
+
+    @property
+    def edge_attributes(self) -> ak.DataFrame:
+        """Dataframe containing the edges of the graph and their attributes. Loading attributes
+        stores the columns in a dictionary, which is only turned into an `ak.DataFrame` the first
+        time this attribute is accessed."""
+        if not isinstance(self._edge_attributes, ak.DataFrame):
+            self._edge_attributes = ak.DataFrame(self._edge_attributes) \
+                                    if self._edge_attributes else ak.DataFrame()
+        return self._edge_attributes
+
+    @edge_attributes.setter
+    def edge_attributes(self, edge_attributes:ak.DataFrame) -> None:
+        self._edge_attributes = edge_attributes
+
+    @property
+    def node_attributes(self) -> ak.DataFrame:
+        """Dataframe containing the nodes of the graph and their attributes. Loading attributes
+        stores the columns in a dictionary, which is only turned into an `ak.DataFrame` the first
+        time this attribute is accessed."""
+        if not isinstance(self._node_attributes, ak.DataFrame):
+            self._node_attributes = ak.DataFrame(self._node_attributes) \
+                                    if self._node_attributes else ak.DataFrame()
+        return self._node_attributes
+
+    @node_attributes.setter
+    def node_attributes(self, node_attributes:ak.DataFrame) -> None:
+        self._node_attributes = node_attributes
+
+    def add_edges_from(self,
+                       input_src:ak.pdarray,
+                       input_dst:ak.pdarray,
+                       input_weight:Union[None,ak.pdarray] = None,
+                       no_self_loops:bool = False,
+                       generate_reversed_arrays:bool = False) -> None:
+        """Populates the graph with edges and vertices, see `DiGraph.add_edges_from`. Invalidates
+        the cached nodes and edges of the graph. The new graph holds no attributes, so all node and
+        edge attributes are dropped.
+
+        Returns
+        -------
+        None
+        """
+        self._nodes_cache = None
+        self._edges_cache = None
+        self._internal_edges_cache = None
+        self._reset_attributes()
+        super().add_edges_from(input_src, input_dst, input_weight=input_weight,
+                               no_self_loops=no_self_loops,
+                               generate_reversed_arrays=generate_reversed_arrays)
+
+    def _reset_node_attributes(self) -> None:
+        """Drops the node attributes held by the `PropGraph` object. Does not modify the back-end
+        graph."""
+        self.node_name = ()
+        self._node_attributes = {}
         self.label_columns = []
 
+    def _reset_edge_attributes(self) -> None:
+        """Drops the edge attributes held by the `PropGraph` object. Does not modify the back-end
+        graph."""
+        self.edge_names = ()
+        self._edge_attributes = {}
+        self.relationship_columns = []
+
+    def _reset_attributes(self) -> None:
+        """Drops all node and edge attributes held by the `PropGraph` object. Does not modify the
+        back-end graph."""
+        self._reset_node_attributes()
+        self._reset_edge_attributes()
+
+    def _clear_attributes(self, components:List[str]) -> None:
+        """Removes the attribute `components` from the back-end graph without rebuilding it. Valid
+        components are `VERTEX_LABELS`, `EDGE_RELATIONSHIPS`, `VERTEX_PROPERTIES` and
+        `EDGE_PROPERTIES`. Does not modify the `PropGraph` object."""
+        args = { "GraphName" : self.name,
+                 "NumComponents" : len(components),
+                 "ComponentNames" : components
+        }
+        ak.generic_msg(cmd="clearAttributes", args=args)
+
+    def nodes(self) -> ak.pdarray:
+        """Returns the nodes of the graph as a pdarray. The result is fetched from the server once
+        and reused until the edges of the graph change, so it should not be modified in place.
+
+        Returns
+        -------
+        nodes: pdarray.
+            The array containing the vertex information of a graph.
+        """
+        if self._nodes_cache is None:
+            self._nodes_cache = super().nodes()
+        return self._nodes_cache
+
+    def edges(self) -> Tuple[ak.pdarray, ak.pdarray]:
+        """Returns a tuple of pdarrays src and dst. The result is fetched from the server once and
+        reused until the edges of the graph change, so it should not be modified in place.
+
+        Returns
+        -------
+        (src, dst): tuple.
+            The arrays containing the edge information of a graph.
+        """
+        if self._edges_cache is None:
+            self._edges_cache = super().edges()
+        return self._edges_cache
+
+    def _internal_edges(self) -> Tuple[ak.pdarray, ak.pdarray]:
+        """Returns a tuple of pdarrays src and dst with internal vertex names. Cached like `edges`.
+
+        Returns
+        -------
+        (src, dst): tuple.
+            The arrays containing the edge information of a graph.
+        """
+        if self._internal_edges_cache is None:
+            self._internal_edges_cache = super()._internal_edges()
+        return self._internal_edges_cache
+
     def add_node_labels(self,
                         labels:ak.DataFrame,
                         node_column:str,
@@ -121,15 +377,14 @@ class PropGraph(ar.DiGraph):
         -------
         None
         """
-        cmd = "addNodeLabels"
-
-        # 0. Do preliminary check to make sure any attribute (column) names do not already exist.
-        try:
-            [self.node_attributes[col] for col in labels.columns]
-        except KeyError as exc:
-            raise KeyError("duplicated attribute (column) name in labels") from exc
-
-        # 1. Extract the nodes from the dataframe and drop them from the labels dataframe.
+        # Do preliminary check to make sure any attribute (column) names do not already exist.
+        existing_columns = set(_column_names(self._node_attributes))
+        duplicated_columns = [col for col in labels.columns
+                              if col != node_column and col in existing_columns]
+        if duplicated_columns:
+            raise KeyError(f"duplicated attribute (column) name in labels: {duplicated_columns}")
+
+        # Extract the nodes from the dataframe and drop them from the labels dataframe.
         vertex_ids = None
         try:
             vertex_ids = labels[node_column]
@@ -137,67 +392,59 @@ class PropGraph(ar.DiGraph):
             raise KeyError("column for nodes does not exist in labels") from exc
         labels.drop(node_column, axis=1, inplace=True)
 
-        # 2. Convert labels to integers and store the index to label mapping in the label_mapper.
-        vertex_labels_symbol_table_ids = []
-        vertex_labels_object_types = []
-        for col in labels.columns:
-            if isinstance(labels[col], ak.Strings) and convert_strings_to_categoricals:
-                self.node_attributes[col] = ak.Categorical(labels[col])
-                self.node_attributes[col].register(generate_string())
-                vertex_labels_symbol_table_ids.append(self.node_attributes[col].registered_name)
-                vertex_labels_object_types.append("Categorical")
-            elif isinstance(labels[col], ak.Strings) and not convert_strings_to_categoricals:
-                self.node_attributes[col] = labels[col]
-                vertex_labels_symbol_table_ids.append(self.node_attributes[col].name)
-                vertex_labels_object_types.append("Strings")
-            elif isinstance(labels[col], ak.Categorical):
-                self.node_attributes[col] = labels[col]
-                self.node_attributes[col].register(generate_string())
-                vertex_labels_symbol_table_ids.append(self.node_attributes[col].name)
-                vertex_labels_object_types.append("Categorical")
-            elif isinstance(labels[col], ak.pdarray):
-                self.node_attributes[col] = labels[col]
-                vertex_labels_symbol_table_ids.append(self.node_attributes[col].name)
-                vertex_labels_object_types.append("pdarray")
-            else:
-                raise NotImplementedError(f"{type(labels[col])} not supported by property graph")
-            self.label_columns.append(col)
-
-        # 3. Convert the vertex ids to internal vertex ids.
-        vertex_map = self.nodes()
-        inds = ak.in1d(vertex_ids, vertex_map) # Gets rid of vertex_ids that do not exist.
-        vertex_ids = vertex_ids[inds]
-        labels = labels[inds]
-        vertex_ids = ak.find(vertex_ids, vertex_map) # Generated internal vertex representations.
-
-        # 4. GroupBy to sort the vertex ids and remove duplicates. Perform only if the vertices have
-        #    not been sorted previously.
-        if not assume_sorted:
-            gb_vertex_ids = ak.GroupBy(vertex_ids)
-            inds = gb_vertex_ids.permutation[gb_vertex_ids.segments]
+        # Convert the vertex ids to internal vertex ids, vertex ids that do not exist are found as
+        # -1 and removed. If the vertices have not been sorted previously, they are also sorted and
+        # deduplicated with the same gather.
+        vertex_ids = ak.find(vertex_ids, self.nodes())
+        if assume_sorted:
+            inds = vertex_ids >= 0
             vertex_ids = vertex_ids[inds]
-            labels = labels[inds]
+        else:
+            (inds, vertex_ids) = _first_found_rows(vertex_ids)
+        labels = {col: labels[col][inds] for col in labels.columns}
+
+        self._add_node_labels(vertex_ids, labels,
+                              convert_strings_to_categoricals=convert_strings_to_categoricals)
+
+    def _add_node_labels(self,
+                         vertex_ids:ak.pdarray,
+                         labels:Dict,
+                         convert_strings_to_categoricals:bool=True) -> None:
+        """Worker for `add_node_labels` that takes the sorted and deduplicated internal vertex ids
+        and a dictionary of label columns instead of a dataframe and skips the duplicated column
+        check. Used directly by `load_node_attributes` where the label columns are already part of
+        `node_attributes`."""
+        cmd = "addNodeLabels"
+        _check_column_sizes(self._node_attributes, labels)
+
+        # 1. Convert labels to integers and store the index to label mapping in the label_mapper.
+        (labels, vertex_labels_symbol_table_ids, vertex_labels_object_types) = \
+            _prepare_attribute_columns(labels, convert_strings_to_categoricals)
+        for col, values in labels.items():
+            self._node_attributes[col] = values
+        self.label_columns.extend(labels)
 
-        # 5. Prepare arguments to transmit to the Chapel back-end server.
+        # 2. Prepare arguments to transmit to the Chapel back-end server.
         args = { "GraphName" : self.name,
                  "InputIndicesName" : vertex_ids.name,
-                 "LabelColumnNames" : "+".join(labels.columns),
-                 "LabelArrayNames" : "+".join(vertex_labels_symbol_table_ids),
-                 "LabelArrayTypes" : "+".join(vertex_labels_object_types)
+                 "NumColumns" : len(labels),
+                 "LabelColumnNames" : list(labels),
+                 "LabelArrayNames" : vertex_labels_symbol_table_ids,
+                 "LabelArrayTypes" : vertex_labels_object_types
         }
         ak.generic_msg(cmd=cmd, args=args)
 
     def load_node_attributes(self,
                              node_attributes:ak.DataFrame,
                              node_column:str,
-                             label_columns:Union[List[str],None] = None,
+                             label_columns:Union[List[str],str,None] = None,
                              convert_string_labels_to_categoricals:bool=True) -> None:
         """Populates the graph object with attributes derived from the columns of a dataframe. Node
         properties are different from node labels where labels just extra identifiers for nodes.
         On the other hand, properties are key-value pairs more akin to storing the columns of a 
         dataframe. The column to be used as the node labels can be denoted by setting the 
         `label_column` parameter. A node can have multiple labels so `label_column` can be a list
-        of column names.
+        of column names. Node attributes loaded or added previously are replaced.
 
         **Graph must already be pupulated with edges prior to calling this method**.
         
@@ -208,7 +455,7 @@ class PropGraph(ar.DiGraph):
                            "attributeN" : attributeN})`
         node_column : str
             The column denoting the values to be treated as the nodes of the graph.
-        label_columns : Union[List(str),None]
+        label_columns : Union[List(str),str,None]
             Name of the column(s) to be used to denote the labels of the nodes.
         convert_string_labels_to_categoricals : bool
             If True, Strings are converted to categoricals when node labels are added, if any.
@@ -222,68 +469,52 @@ class PropGraph(ar.DiGraph):
         columns = node_attributes.columns
 
         ### Modify the inputted dataframe by sorting it.
-        # 1. Sort the data and remove duplicates since each node can only have one instance of a
-        #    property.
-        node_attributes_gb = node_attributes.groupby([ node_column ])
-        node_attributes = node_attributes[
-                            node_attributes_gb.permutation[node_attributes_gb.segments]
-                        ]
-
-        # 2. Store the modified edge attributes into the class variable.
-        self.node_attributes = node_attributes
-        self.node_attributes.reset_index(inplace=True)
-
-        # 3. Extract the nodes column as a pdarray.
-        nodes = self.node_attributes[node_column]
+        # 1. Generate internal indices for the nodes, nodes that do not exist are found as -1.
+        vertex_ids = ak.find(node_attributes[node_column], self.nodes())
+
+        # 2. Sort the data, remove duplicates since each node can only have one instance of a
+        #    property, and remove nodes that do not exist with a single gather per column. The
+        #    columns are kept in a dictionary, `node_attributes` builds the dataframe on access.
+        (inds, vertex_ids) = _first_found_rows(vertex_ids)
+        node_attributes = {col: node_attributes[col][inds] for col in columns}
+
+        # 3. Store the modified node attributes into the class variable, replacing any node
+        #    attributes loaded previously on both the object and the back-end graph.
+        if _column_names(self._node_attributes) or self.label_columns:
+            self._reset_node_attributes()
+            self._clear_attributes(["VERTEX_LABELS", "VERTEX_PROPERTIES"])
+        self._node_attributes = node_attributes
 
         # 4. Store the name of the nodes column.
         self.node_name = node_column
 
         # 5. Populate the graph object with labels if specified.
-        if label_columns is not None and isinstance(label_columns, list):
-            labels_to_add = {col: node_attributes[col] for col in label_columns}
-            labels_to_add[node_column] = nodes
-            self.add_node_labels(ak.DataFrame(labels_to_add), node_column, assume_sorted=True,
-                                 convert_strings_to_categoricals=\
-                                 convert_string_labels_to_categoricals)
+        if isinstance(label_columns, str):
+            label_columns = [label_columns]
+        if label_columns:
+            self._add_node_labels(vertex_ids, {col: node_attributes[col] for col in label_columns},
+                                  convert_strings_to_categoricals=\
+                                  convert_string_labels_to_categoricals)
 
         ### Prepare the columns that are to be sent to the back-end to be stored per node.
         # 1. From columns remove nodes and any other columns that were handled by adding node
         #    labels.
-        columns = [col for col in columns if col not in label_columns]\
-                  if label_columns is not None else list(columns)
-        columns.remove(node_column)
+        excluded_columns = set(label_columns) if label_columns is not None else set()
+        excluded_columns.add(node_column)
+        columns = [col for col in columns if col not in excluded_columns]
+        if not columns:
+            return
 
         # 2. Extract symbol table names of arrays to use in the back-end and their types.
-        column_ids = []
-        vertex_property_object_types = []
-        for col in columns:
-            if isinstance(self.node_attributes[col], ak.Strings):
-                vertex_property_object_types.append("Strings")
-                column_ids.append(self.node_attributes[col].name)
-            elif isinstance(self.node_attributes[col], ak.Categorical):
-                vertex_property_object_types.append("Categorical")
-                self.node_attributes[col].register(generate_string())
-                column_ids.append(self.node_attributes[col].registered_name)
-            elif isinstance(self.node_attributes[col], ak.pdarray):
-                vertex_property_object_types.append("pdarray")
-                column_ids.append(self.node_attributes[col].name)
-            else:
-                raise NotImplementedError(f"{type(self.node_attributes[col])} "
-                                          f"not supported by property graph")
-
-        # 3. Generate internal indices for the nodes.
-        vertex_map = self.nodes()
-        inds = ak.in1d(nodes, vertex_map) # Gets rid of vertex_ids that do not exist.
-        vertex_ids = nodes[inds]
-        node_attributes = node_attributes[inds]
-        vertex_ids = ak.find(vertex_ids, vertex_map) # Generated internal vertex representations.
+        (_, column_ids, vertex_property_object_types) = _prepare_attribute_columns(
+            {col: node_attributes[col] for col in columns}, False)
 
         args = { "GraphName" : self.name,
                  "InputIndicesName" : vertex_ids.name,
-                 "ColumnNames" : "+".join(columns),
-                 "PropertyArrayNames" : "+".join(column_ids),
-                 "PropertyArrayTypes" : "+".join(vertex_property_object_types)
+                 "NumColumns" : len(columns),
+                 "ColumnNames" : columns,
+                 "PropertyArrayNames" : column_ids,
+                 "PropertyArrayTypes" : vertex_property_object_types
                }
         ak.generic_msg(cmd=cmd, args=args)
 
@@ -317,13 +548,14 @@ class PropGraph(ar.DiGraph):
         -------
         None
         """
-        cmd = "addEdgeRelationships"
-
-        # 0. Do preliminary check to make sure any attribute (column) names do not already exist.
-        try:
-            [self.edge_attributes[col] for col in relationships.columns]
-        except KeyError as exc:
-            raise KeyError("duplicated attribute (column) name in relationships") from exc
+        # Do preliminary check to make sure any attribute (column) names do not already exist.
+        existing_columns = set(_column_names(self._edge_attributes))
+        duplicated_columns = [col for col in relationships.columns
+                              if col not in (source_column, desination_column)
+                              and col in existing_columns]
+        if duplicated_columns:
+            raise KeyError(f"duplicated attribute (column) name in relationships: "
+                           f"{duplicated_columns}")
 
         # 1. Extract the nodes from the dataframe and drop them from the labels dataframe.
         src, dst = (None, None)
@@ -333,52 +565,48 @@ class PropGraph(ar.DiGraph):
             raise KeyError("source or destination columns do not exist in relationship") from exc
         relationships.drop([source_column, desination_column], axis=1, inplace=True)
 
-        # 2. Convert relationships to integers and store the index to relationship mapping in
+        # 2. Generate internal edge indices, edges that do not exist are found as -1 and removed.
+        #    If the edges have not been sorted previously, they are also sorted and deduplicated
+        #    by their single integer index instead of by the (src, dst) pair.
+        internal_edge_indices = self._internal_edge_indices(src, dst)
+        if assume_sorted:
+            inds = internal_edge_indices >= 0
+            internal_edge_indices = internal_edge_indices[inds]
+        else:
+            (inds, internal_edge_indices) = _first_found_rows(internal_edge_indices)
+
+        self._add_edge_relationships(internal_edge_indices,
+                                     {col: relationships[col][inds]
+                                      for col in relationships.columns},
+                                     convert_strings_to_categoricals=\
+                                     convert_strings_to_categoricals)
+
+    def _add_edge_relationships(self,
+                                internal_edge_indices:ak.pdarray,
+                                relationships:Dict,
+                                convert_strings_to_categoricals:bool=True) -> None:
+        """Worker for `add_edge_relationships` that takes the internal indices of the sorted and
+        deduplicated edges and a dictionary of relationship columns instead of a dataframe and
+        skips the duplicated column check. Used directly by `load_edge_attributes` where the
+        relationship columns are already part of `edge_attributes`."""
+        cmd = "addEdgeRelationships"
+        _check_column_sizes(self._edge_attributes, relationships)
+
+        # 1. Convert relationships to integers and store the index to relationship mapping in
         #    the relationship_mapper.
-        edge_relationships_symbol_table_ids = []
-        edge_relationships_object_types = []
-        for col in relationships.columns:
-            if isinstance(relationships[col], ak.Strings) and convert_strings_to_categoricals:
-                self.edge_attributes[col] = ak.Categorical(relationships[col])
-                self.edge_attributes[col].register(generate_string())
-                edge_relationships_symbol_table_ids.append(self.edge_attributes[col].registered_name)
-                edge_relationships_object_types.append("Categorical")
-            elif isinstance(relationships[col], ak.Strings) and not convert_strings_to_categoricals:
-                self.edge_attributes[col] = relationships[col]
-                edge_relationships_symbol_table_ids.append(self.edge_attributes[col].name)
-                edge_relationships_object_types.append("Strings")
-            elif isinstance(relationships[col], ak.Categorical):
-                self.edge_attributes[col] = relationships[col]
-                self.edge_attributes[col].register(generate_string())
-                edge_relationships_symbol_table_ids.append(self.edge_attributes[col].name)
-                edge_relationships_object_types.append("Categorical")
-            elif isinstance(relationships[col], ak.pdarray):
-                self.edge_attributes[col] = relationships[col]
-                edge_relationships_symbol_table_ids.append(self.edge_attributes[col].name)
-                edge_relationships_object_types.append("pdarray")
-            else:
-                raise NotImplementedError(f"{type(relationships[col])} not "
-                                          f"supported by property graph")
-            self.relationship_columns.append(col)
-
-        # 3. GroupBy of the src and dst vertex ids and relationships to remove any duplicates.
-        #    Perform only if the edges have not been sorted previously.
-        if not assume_sorted:
-            gb_edges = ak.GroupBy([src,dst])
-            inds = gb_edges.permutation[gb_edges.segments]
-            src = src[inds]
-            dst = dst[inds]
-            relationships = relationships[inds]
-
-        # 4. Generate internal edge indices.
-        edges = self.edges()
-        internal_edge_indices = ak.find([src,dst],[edges[0],edges[1]])
+        (relationships, edge_relationships_symbol_table_ids, edge_relationships_object_types) = \
+            _prepare_attribute_columns(relationships, convert_strings_to_categoricals)
+        for col, values in relationships.items():
+            self._edge_attributes[col] = values
+        self.relationship_columns.extend(relationships)
 
+        # 2. Prepare arguments to transmit to the Chapel back-end server.
         args = {  "GraphName" : self.name,
                   "InputIndicesName" : internal_edge_indices.name, 
-                  "RelationshipColumnNames" : "+".join(relationships.columns),
-                  "RelationshipArrayNames" : "+".join(edge_relationships_symbol_table_ids),
-                  "RelationshipArrayTypes" : "+".join(edge_relationships_object_types)
+                  "NumColumns" : len(relationships),
+                  "RelationshipColumnNames" : list(relationships),
+                  "RelationshipArrayNames" : edge_relationships_symbol_table_ids,
+                  "RelationshipArrayTypes" : edge_relationships_object_types
         }
         ak.generic_msg(cmd=cmd, args=args)
 
@@ -386,13 +614,18 @@ class PropGraph(ar.DiGraph):
                              edge_attributes:ak.DataFrame,
                              source_column:str,
                              destination_column:str,
-                             relationship_columns:Union[List[str]|None] = None,
-                             convert_string_relationships_to_categoricals:bool=True) -> None:
+                             relationship_columns:Union[List[str],str,None] = None,
+                             convert_string_relationships_to_categoricals:bool=True,
+                             reload_topology:bool=False) -> None:
         """Populates the graph object with attributes derived from the columns of a dataframe. Edge
         properties are different from edge relationships where relationships are used to tell apart
         multiple edges. On the other hand, properties are key-value pairs more akin to storing the 
         columns of a dataframe. The column to be used as the edge relationship can be denoted by 
         setting the `relationship_column` parameter.
+
+        Loading edge attributes replaces all attributes of the graph, node attributes included, so
+        they have to be loaded again afterwards. If the graph already holds exactly the edges in
+        `edge_attributes`, the graph is not rebuilt and its previous attributes are cleared instead.
         
         Parameters
         ----------
@@ -405,11 +638,13 @@ class PropGraph(ar.DiGraph):
         destination_column : str
             The column denoting the values to be treated as the destination vertices of an edge in
             a graph.
-        relationship_columns : str | None
-            Name of the column to be used to denote the relationships of each edge. If unset, no
+        relationship_columns : Union[List(str),str,None]
+            Name of the column(s) to be used to denote the relationships of each edge. If unset, no
             column is used as relationships and multiple edges will be deleted.
         convert_strings_to_categoricals : bool
             If True, converts Strings to Categorical in adding edge relationships, if any. 
+        reload_topology : bool
+            If True, the graph is always rebuilt from the edges in `edge_attributes`.
 
         See Also
         --------
@@ -420,97 +655,142 @@ class PropGraph(ar.DiGraph):
         columns = edge_attributes.columns
 
         ### Modify the inputted dataframe by sorting it and removing duplicates.
-        # 1. Sort the data and remove duplicates.
-        edge_attributes_gb = edge_attributes.groupby([source_column, destination_column])
-        edge_attributes = edge_attributes[edge_attributes_gb.permutation
-                                          [edge_attributes_gb.segments]
-                                        ]
+        # 1. Sort the data and remove duplicates, keeping the first row of each edge, with a single
+        #    gather per column. The columns are kept in a dictionary, `edge_attributes` builds the
+        #    dataframe on access.
+        gb_edges = ak.GroupBy([edge_attributes[source_column], edge_attributes[destination_column]])
+        inds = gb_edges.permutation[gb_edges.segments]
+        edge_attributes = {col: edge_attributes[col][inds] for col in columns}
         self.multied = 0 # TODO: Multigraphs are planned work.
 
-        # 2. Store the modified edge attributes into the class variable.
-        self.edge_attributes = edge_attributes
-        self.edge_attributes.reset_index(inplace=True)
-
-        # 3. Initialize our src and destination arrays.
+        # 2. Initialize our src and destination arrays.
         src = edge_attributes[source_column]
         dst = edge_attributes[destination_column]
 
-        # 4. Add edge source and destination column names to property graph.
+        ### Build the graph and load in relationships.
+        # 1. Populate the graph object with edges, unless it already holds the same edge set. In
+        #    both cases the graph is left without any attributes.
+        if reload_topology or not self._has_same_edges(src, dst):
+            self.add_edges_from(src, dst)
+        else:
+            self._reset_attributes()
+            self._clear_attributes(["VERTEX_LABELS", "EDGE_RELATIONSHIPS",
+                                    "VERTEX_PROPERTIES", "EDGE_PROPERTIES"])
+
+        # 2. Store the modified edge attributes and the edge source and destination column names.
+        self._edge_attributes = edge_attributes
         self.edge_names = (source_column, destination_column)
 
-        ### Build the graph and load in relationships.
-        # 1. Populate the graph object with edges.
-        super().add_edges_from(src, dst)
+        # 3. Generate internal indices for the edges, shared by relationships and properties.
+        internal_indices = self._internal_edge_indices(src, dst)
 
-        # 2. Populate the graph object with relationships.
-        if relationship_columns is not None and isinstance(relationship_columns, list):
+        # 4. Populate the graph object with relationships.
+        if isinstance(relationship_columns, str):
+            relationship_columns = [relationship_columns]
+        if relationship_columns:
             relationships_to_add = {col: edge_attributes[col] for col in relationship_columns}
-            relationships_to_add[source_column] = src
-            relationships_to_add[destination_column] = dst
-            self.add_edge_relationships(ak.DataFrame(relationships_to_add),
-                                                     source_column,
-                                                     destination_column,
-                                                     assume_sorted=True,
-                                                     convert_strings_to_categoricals=\
-                                                     convert_string_relationships_to_categoricals)
+            self._add_edge_relationships(internal_indices, relationships_to_add,
+                                         convert_strings_to_categoricals=\
+                                         convert_string_relationships_to_categoricals)
 
         ### Prepare the columns that are to be sent to the back-end to be stored per-edge.
         # 1. Remove edges since those are sent separately and any columns marked as relationships.
-        columns = [col for col in columns if col not in relationship_columns]\
-                  if relationship_columns is not None else list(columns)
-        columns.remove(source_column)
-        columns.remove(destination_column)
+        excluded_columns = set(relationship_columns) if relationship_columns is not None else set()
+        excluded_columns.update((source_column, destination_column))
+        columns = [col for col in columns if col not in excluded_columns]
+        if not columns:
+            return
 
         # 2. Extract symbol table names of arrays to use in the back-end.
-        column_ids = []
-        edge_property_object_types = []
-        for col in columns:
-            if isinstance(self.edge_attributes[col], ak.Strings):
-                edge_property_object_types.append("Strings")
-                column_ids.append(self.edge_attributes[col].name)
-            elif isinstance(self.edge_attributes[col], ak.Categorical):
-                edge_property_object_types.append("Categorical")
-                self.edge_attributes[col].register(generate_string())
-                column_ids.append(self.edge_attributes[col].registered_name)
-            elif isinstance(self.edge_attributes[col], ak.pdarray):
-                edge_property_object_types.append("pdarray")
-                column_ids.append(self.edge_attributes[col].name)
-            else:
-                raise NotImplementedError(f"{type(self.edge_attributes[col])} "
-                                          f"not supported by property graph")
-
-        # 3. Generate internal indices for the edges.
-        edges = self.edges()
-        internal_indices = ak.find([src,dst], [edges[0],edges[1]])
+        (_, column_ids, edge_property_object_types) = _prepare_attribute_columns(
+            {col: edge_attributes[col] for col in columns}, False)
 
         args = { "GraphName" : self.name,
                 "InputIndicesName" : internal_indices.name,
-                 "ColumnNames" : "+".join(columns),
-                 "PropertyArrayNames" : "+".join(column_ids),
-                 "PropertyArrayTypes" : "+".join(edge_property_object_types)
+                 "NumColumns" : len(columns),
+                 "ColumnNames" : columns,
+                 "PropertyArrayNames" : column_ids,
+                 "PropertyArrayTypes" : edge_property_object_types
                }
         ak.generic_msg(cmd=cmd, args=args)
 
-    def get_node_labels(self) -> ak.DataFrame:
-        """Returns a a dataframe with the nodes and their labels.
+    def _has_same_edges(self, src:ak.pdarray, dst:ak.pdarray) -> bool:
+        """Returns True if the graph is built and its edges are exactly the sorted and deduplicated
+        edges `(src[i], dst[i])`. The sizes are compared first so the element-wise comparison only
+        runs when the edge sets can be equal.
+
+        Parameters
+        ----------
+        src : ak.pdarray
+            Sorted and deduplicated source vertices, in original vertex names.
+        dst : ak.pdarray
+            Sorted and deduplicated destination vertices, in original vertex names.
+
+        Returns
+        -------
+        bool
+        """
+        if self.name is None or src.size != self.n_edges:
+            return False
+        (graph_src, graph_dst) = self.edges()
+        return bool(((graph_src == src) & (graph_dst == dst)).all())
+
+    def _internal_edge_indices(self, src:ak.pdarray, dst:ak.pdarray) -> ak.pdarray:
+        """Returns the internal edge index of each edge `(src[i], dst[i])`, or -1 if the edge does
+        not exist in the graph. Both endpoints are converted to internal vertex ids with one
+        `ak.find` and each edge is packed into a single 64-bit key, source in the upper 32 bits
+        and destination in the lower 32 bits, so that the lookup against the internal edge list
+        is also a single-key `ak.find`. Graphs with 2**31 or more vertices fall back to a two-key
+        `ak.find`.
+
+        Parameters
+        ----------
+        src : ak.pdarray
+            Source vertices of the edges, in original vertex names.
+        dst : ak.pdarray
+            Destination vertices of the edges, in original vertex names.
+
+        Returns
+        -------
+        ak.pdarray
+            The internal edge indices.
+        """
+        # 1. Convert both endpoints to internal vertex ids in one pass over the vertex map.
+        internal_vertices = ak.find(ak.concatenate([src, dst]), self.nodes())
+        internal_src = internal_vertices[0:src.size]
+        internal_dst = internal_vertices[src.size:]
+
+        (graph_src, graph_dst) = self._internal_edges()
+        if self.n_vertices >= 2**31:
+            return ak.find([internal_src, internal_dst], [graph_src, graph_dst])
+
+        # 2. Pack the edges into single integers, edges with missing endpoints are given a key
+        #    that can never match.
+        found = (internal_src >= 0) & (internal_dst >= 0)
+        keys = ak.where(found, (internal_src << 32) | internal_dst, -1)
+
+        # 3. Search for the keys in the similarly packed internal edge list.
+        return ak.find(keys, (graph_src << 32) | graph_dst)
+
+    def get_node_labels(self) -> AttributeView:
+        """Returns a view of the node attributes with the nodes and their labels. Columns are
+        accessed by name like a dataframe, `to_dataframe()` materializes a copy.
 
         Returns
         -------
-        `ak.DataFrame``
+        `AttributeView`
             The node labels of the property graph.
         
         Raises
         ------
         KeyError
         """
-        labels = None
-        try:
-            ns = [self.node_name]
-            ns.extend(self.label_columns)
-            labels = self.node_attributes[ns]
-        except KeyError as exc:
-            raise KeyError("no label(s) found") from exc
-        return labels
+        ns = [self.node_name]
+        ns.extend(self.label_columns)
+        existing_columns = set(_column_names(self._node_attributes))
+        if any(col not in existing_columns for col in ns):
+            raise KeyError("no label(s) found")
+        return AttributeView(self.node_attributes, ns)
 
     def get_node_attributes(self) -> ak.DataFrame:
         """Returns the `ak.DataFrame` object holding all the node attributes of the `PropGraph`
@@ -523,22 +803,25 @@ class PropGraph(ar.DiGraph):
         """
         return self.node_attributes
 
-    def get_edge_relationships(self) -> ak.DataFrame:
-        """Returns a a dataframe with the edges and their relationships.
+    def get_edge_relationships(self) -> AttributeView:
+        """Returns a view of the edge attributes with the edges and their relationships. Columns
+        are accessed by name like a dataframe, `to_dataframe()` materializes a copy.
 
         Returns
         -------
-        `ak.DataFrame`
+        `AttributeView`
             The edge relationships of the property graph.
+
+        Raises
+        ------
+        KeyError
         """
-        relationships = None
-        try:
-            es = list(self.edge_names)
-            es.extend(self.relationship_columns)
-            relationships = self.edge_attributes[es]
-        except KeyError as exc:
-            raise KeyError("no relationship(s) found") from exc
-        return relationships
+        es = list(self.edge_names)
+        es.extend(self.relationship_columns)
+        existing_columns = set(_column_names(self._edge_attributes))
+        if any(col not in existing_columns for col in es):
+            raise KeyError("no relationship(s) found")
+        return AttributeView(self.edge_attributes, es)
 
     def get_edge_attributes(self) -> ak.DataFrame:
         """Returns the `ak.DataFrame` object holding all the edge attributes of the `PropGraph`
@@ -573,12 +856,8 @@ class PropGraph(ar.DiGraph):
         nodes = self.node_attributes[list(node_types.keys())].isin(node_types)
         edges = self.edge_attributes[list(edge_types.keys())].isin(edge_types)
 
-        print(f"nodes = {nodes.__repr__}")
-        print(f"edges = {edges.__repr__}")
-
         # 2. Find the overlap of returned edges and returned nodes.
-        src = ak.in1d(edges[0], nodes)
-        dst = ak.in1d(edges[1], nodes)
+        (src, dst) = _in1d_pair(edges[0], edges[1], nodes)
 
         # 3. Perform a Boolean and operation to keep only the edges where nodes were also returned
         #    in a query.
@@ -627,8 +906,7 @@ class PropGraph(ar.DiGraph):
         src = edges[0][filtered_edges]
         dst = edges[1][filtered_edges]
 
-        src_in_nodes = ak.in1d(src, nodes)
-        dst_in_nodes = ak.in1d(dst, nodes)
+        (src_in_nodes, dst_in_nodes) = _in1d_pair(src, dst, nodes)
 
         kept_edges = src_in_nodes & dst_in_nodes if filter_edge.__name__ != "no_filter" else\
                      src_in_nodes | dst_in_nodes
@@ -45,9 +45,10 @@ module BuildPropertyGraphMsg {
         // Parse the message from Python.
         var graphName = msgArgs.getValueOf("GraphName");
         var inputIndicesName = msgArgs.getValueOf("InputIndicesName");
-        var labelColumnNames = msgArgs.getValueOf("LabelColumnNames").split("+");
-        var labelArrayNames = msgArgs.getValueOf("LabelArrayNames").split("+");
-        var labelArrayTypes = msgArgs.getValueOf("LabelArrayTypes").split("+");
+        var numColumns = msgArgs.getValueOf("NumColumns"):int;
+        var labelColumnNames = msgArgs.get("LabelColumnNames").getList(numColumns);
+        var labelArrayNames = msgArgs.get("LabelArrayNames").getList(numColumns);
+        var labelArrayTypes = msgArgs.get("LabelArrayTypes").getList(numColumns);
 
         // Map to keep track of symbol table id for a label array to the dataframe column name and
         // its object type.
@@ -101,8 +102,8 @@ module BuildPropertyGraphMsg {
         );
         timer.stop();
 
-        // Add the component for the vertex labels for the graph.
-        graph.withComp(new shared MapSymEntry(vertexLabels):GenSymEntry, "VERTEX_LABELS");
+        // Add the vertex labels to the graph, merging them with any labels added previously.
+        graph.withAttributes(vertexLabels, "VERTEX_LABELS");
         timer.stop();
         outMsg = "addNodeLabels took " + timer.elapsed():string + " sec ";
         
@@ -132,9 +133,10 @@ module BuildPropertyGraphMsg {
         // Parse the message from Python to extract needed data. 
         var graphName = msgArgs.getValueOf("GraphName");
         var inputIndicesName = msgArgs.getValueOf("InputIndicesName");
-        var columnNames = msgArgs.getValueOf("ColumnNames").split("+");
-        var propertyArrayNames = msgArgs.getValueOf("PropertyArrayNames").split("+");
-        var propertyArrayTypes = msgArgs.getValueOf("PropertyArrayTypes").split("+");
+        var numColumns = msgArgs.getValueOf("NumColumns"):int;
+        var columnNames = msgArgs.get("ColumnNames").getList(numColumns);
+        var propertyArrayNames = msgArgs.get("PropertyArrayNames").getList(numColumns);
+        var propertyArrayTypes = msgArgs.get("PropertyArrayTypes").getList(numColumns);
 
         // Map to keep track of the symbol table id for a property array to the dataframe column
         // name and the label it belongs to, if applicable.
@@ -185,8 +187,8 @@ module BuildPropertyGraphMsg {
         );
         timer.stop();
 
-        // Add the component for the vertex properties for the graph.
-        graph.withComp(new shared MapSymEntry(vertexProps):GenSymEntry, "VERTEX_PROPERTIES");
+        // Add the vertex properties to the graph, merging them with any properties added previously.
+        graph.withAttributes(vertexProps, "VERTEX_PROPERTIES");
         timer.stop();
         outMsg = "addNodeProperties took " + timer.elapsed():string + " sec ";
         
@@ -216,9 +218,10 @@ module BuildPropertyGraphMsg {
         // Parse the message from Python.
         var graphName = msgArgs.getValueOf("GraphName");
         var inputIndicesName = msgArgs.getValueOf("InputIndicesName");
-        var relationshipColumnNames = msgArgs.getValueOf("RelationshipColumnNames").split("+");
-        var relationshipArrayNames = msgArgs.getValueOf("RelationshipArrayNames").split("+");
-        var relationshipArrayTypes = msgArgs.getValueOf("RelationshipArrayTypes").split("+");
+        var numColumns = msgArgs.getValueOf("NumColumns"):int;
+        var relationshipColumnNames = msgArgs.get("RelationshipColumnNames").getList(numColumns);
+        var relationshipArrayNames = msgArgs.get("RelationshipArrayNames").getList(numColumns);
+        var relationshipArrayTypes = msgArgs.get("RelationshipArrayTypes").getList(numColumns);
 
         // Map to keep track of symbol table id for a relationship array to the dataframe column 
         // name and its mapper, if applicable.
@@ -272,8 +275,9 @@ module BuildPropertyGraphMsg {
         );
         timer.stop();
 
-        // Add the component for the edge relationships for the graph.
-        graph.withComp(new shared MapSymEntry(edgeRelationships):GenSymEntry, "EDGE_RELATIONSHIPS");
+        // Add the edge relationships to the graph, merging them with any relationships added
+        // previously.
+        graph.withAttributes(edgeRelationships, "EDGE_RELATIONSHIPS");
         timer.stop();
         outMsg = "addEdgeRelationships took " + timer.elapsed():string + " sec ";
         
@@ -304,9 +308,10 @@ module BuildPropertyGraphMsg {
         // Parse the message from Python to extract needed data. 
         var graphName = msgArgs.getValueOf("GraphName");
         var inputIndicesName = msgArgs.getValueOf("InputIndicesName");
-        var columnNames = msgArgs.getValueOf("ColumnNames").split("+");
-        var propertyArrayNames = msgArgs.getValueOf("PropertyArrayNames").split("+");
-        var propertyArrayTypes = msgArgs.getValueOf("PropertyArrayTypes").split("+");
+        var numColumns = msgArgs.getValueOf("NumColumns"):int;
+        var columnNames = msgArgs.get("ColumnNames").getList(numColumns);
+        var propertyArrayNames = msgArgs.get("PropertyArrayNames").getList(numColumns);
+        var propertyArrayTypes = msgArgs.get("PropertyArrayTypes").getList(numColumns);
 
         // Map to keep track of the symbol table id for a property array to the dataframe column
         // name and the label it belongs to, if applicable.
@@ -358,8 +363,8 @@ module BuildPropertyGraphMsg {
         );
         timer.stop();
 
-        // Add the component for the edge properties for the graph.
-        graph.withComp(new shared MapSymEntry(edgeProps):GenSymEntry, "EDGE_PROPERTIES");
+        // Add the edge properties to the graph, merging them with any properties added previously.
+        graph.withAttributes(edgeProps, "EDGE_PROPERTIES");
         timer.stop();
         outMsg = "addEdgeProperties took " + timer.elapsed():string + " sec ";
         
@@ -371,9 +376,61 @@ module BuildPropertyGraphMsg {
         return new MsgTuple(repMsg, MsgType.NORMAL);
     } // end of addEdgePropertiesMsg
 
+    /**
+    Message parser that removes attribute components, any of VERTEX_LABELS, EDGE_RELATIONSHIPS,
+    VERTEX_PROPERTIES and EDGE_PROPERTIES, from a property graph so that attributes can be loaded
+    again without rebuilding the graph.
+    
+    :arg cmd: operation to perform. 
+    :type cmd: string
+    :arg msgArgs: arguments passed to backend. 
+    :type msgArgs: borrowed MessageArgs
+    :arg st: symbol table used for storage.
+    :type st: borrowed SymTab
+    
+    :returns: MsgTuple
+    */
+    proc clearAttributesMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+
+        // Parse the message from Python.
+        var graphName = msgArgs.getValueOf("GraphName");
+        var numComponents = msgArgs.getValueOf("NumComponents"):int;
+        var componentNames = msgArgs.get("ComponentNames").getList(numComponents);
+
+        // Extract the graph whose attributes are removed.
+        var graphEntry: borrowed GraphSymEntry = getGraphSymEntry(graphName, st); 
+        var graph = graphEntry.graph;
+
+        // Only attribute components can be removed, the topology of the graph is left intact.
+        for componentName in componentNames {
+            if componentName != "VERTEX_LABELS" && componentName != "EDGE_RELATIONSHIPS" &&
+               componentName != "VERTEX_PROPERTIES" && componentName != "EDGE_PROPERTIES" {
+                var errorMsg = incompatibleArgumentsError(pn, 
+                                    componentName + " is not an attribute component");
+                bpgmLogger.error(getModuleName(), getRoutineName(), getLineNumber(), errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+
+        var timer:stopwatch;
+        timer.start();
+        for componentName in componentNames do
+            if graph.hasComp(componentName) then graph.withoutComp(componentName);
+        timer.stop();
+        outMsg = "clearAttributes took " + timer.elapsed():string + " sec ";
+        
+        // Print out debug information to arkouda server output. 
+        bpgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),outMsg);
+
+        var repMsg = "attributes cleared";
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    } // end of clearAttributesMsg
+
     use CommandMap;
     registerFunction("addNodeLabels", addNodeLabelsMsg, getModuleName());
     registerFunction("addEdgeRelationships", addEdgeRelationshipsMsg, getModuleName());
     registerFunction("addNodeProperties", addNodePropertiesMsg, getModuleName());
     registerFunction("addEdgeProperties", addEdgePropertiesMsg, getModuleName());
+    registerFunction("clearAttributes", clearAttributesMsg, getModuleName());
 }
\ No newline at end of file
@@ -93,9 +93,27 @@ module GraphArray {
         proc isReversed():bool throws { return this.hasComp("SRC_RDI"); }
 
         proc withComp(a:shared GenSymEntry, atrname:string):SegGraph throws { components.add(atrname:Component, a); return this; }
+        proc withoutComp(atrname:string):SegGraph throws { components.remove(atrname:Component); return this; }
         proc hasComp(atrname:string):bool throws { return components.contains(atrname:Component); }
         proc getComp(atrname:string):GenSymEntry throws { return components[atrname:Component]; }
 
+        /**
+        * Adds the attributes in `attributes` to the attribute component `atrname`, one of
+        * VERTEX_LABELS, EDGE_RELATIONSHIPS, VERTEX_PROPERTIES or EDGE_PROPERTIES. If the component
+        * already exists the maps are merged, attributes with the same column name are replaced.
+        */
+        proc withAttributes(ref attributes:map(string, (string, string)), atrname:string):SegGraph throws {
+            if this.hasComp(atrname) {
+                ref stored = (this.getComp(atrname):(borrowed MapSymEntry(
+                                 string, (string, string)
+                             ))).stored_map;
+                stored.extend(attributes);
+            } else {
+                this.withComp(new shared MapSymEntry(attributes):GenSymEntry, atrname);
+            }
+            return this;
+        }
+
         proc getNodeAttributes() throws {
             var attributes = new map(string, (string, string));
             var emptyMap = new map(string, (string, string));
@@ -91,6 +91,34 @@ class PropGraphTest(ArkoudaTest):
 
         return graph, nx_graph
 
+    def build_small_prop_graph(self, edge_attributes=None, relationship_columns=None):
+        """Builds a property graph with the edges 0 -> 1, 1 -> 2, 2 -> 0 and 2 -> 3 and the given
+        edge attribute columns for tests."""
+        graph = ar.PropGraph()
+        graph.load_edge_attributes(ak.DataFrame({"src":ak.array([0, 1, 2, 2]),
+                                                 "dst":ak.array([1, 2, 0, 3]),
+                                                 **(edge_attributes or {})}),
+                                   source_column="src", destination_column="dst",
+                                   relationship_columns=relationship_columns)
+        return graph
+
+    def holds_attributes(self, graph, edge_attributes=None, relationship_columns=None,
+                         node_attributes=None, label_columns=None):
+        """Returns True if the back-end of `graph` holds the given attributes for the edge from
+        vertex 0 to vertex 1 and for its two endpoints. The check runs a subgraph isomorphism with
+        semantic checking on a single edge pattern, which only matches when every attribute of the
+        pattern is stored by the back-end graph with the same type and value."""
+        pattern = ar.PropGraph()
+        pattern.load_edge_attributes(ak.DataFrame({"src":ak.array([0]), "dst":ak.array([1]),
+                                                   **(edge_attributes or {})}),
+                                     source_column="src", destination_column="dst",
+                                     relationship_columns=relationship_columns)
+        if node_attributes:
+            pattern.load_node_attributes(ak.DataFrame({"nodes":ak.array([0, 1]),
+                                                       **node_attributes}),
+                                         node_column="nodes", label_columns=label_columns)
+        return ar.subgraph_isomorphism(graph, pattern, semantic_check="and").size > 0
+
     def test_subgraph_view(self):
         """Tests subgraph_view function for property graphs."""
         graph,_ = self.build_prop_graph_and_networkx()
@@ -109,6 +137,207 @@ class PropGraphTest(ArkoudaTest):
         self.assertListEqual(subgraph_edges.nodes().to_list(), [1, 3, 5, 6, 8])
         self.assertListEqual(subgraph_together.nodes().to_list(), [1, 6])
 
+    def test_duplicated_attribute_columns(self):
+        """Tests that labels and relationships cannot overwrite existing attribute columns."""
+        graph,_ = self.build_prop_graph_and_networkx()
+        nodes = graph.nodes()
+        src, dst = graph.edges()
+
+        with self.assertRaises(KeyError):
+            graph.add_node_labels(ak.DataFrame({"nodes":nodes, "data1":nodes}), "nodes")
+        with self.assertRaises(KeyError):
+            graph.add_edge_relationships(ak.DataFrame({"src":src, "dst":dst, "data2":src}),
+                                         "src", "dst")
+
+    def test_single_label_and_relationship_column(self):
+        """Tests that a single label or relationship column can be passed as a string without
+        excluding property columns whose names are substrings of it."""
+        graph = self.build_small_prop_graph({"rel":ak.array(["a", "b", "a", "c"]),
+                                             "r":ak.array([1, 2, 3, 4])},
+                                            relationship_columns="rel")
+        graph.load_node_attributes(ak.DataFrame({"nodes":graph.nodes(),
+                                                 "lbl":ak.array(["x", "y", "x", "y"]),
+                                                 "l":ak.array([5, 6, 7, 8])}),
+                                   node_column="nodes", label_columns="lbl")
+
+        self.assertListEqual(graph.relationship_columns, ["rel"])
+        self.assertListEqual(graph.label_columns, ["lbl"])
+        self.assertListEqual(graph.edge_attributes["r"].to_list(), [1, 2, 3, 4])
+        self.assertListEqual(graph.node_attributes["l"].to_list(), [5, 6, 7, 8])
+        self.assertTrue(self.holds_attributes(graph,
+                                              edge_attributes={"rel":ak.array(["a"]),
+                                                               "r":ak.array([1])},
+                                              relationship_columns="rel",
+                                              node_attributes={"lbl":ak.array(["x", "y"]),
+                                                               "l":ak.array([5, 6])},
+                                              label_columns="lbl"))
+
+    def test_multiple_string_label_columns(self):
+        """Tests that each converted string column only holds its own categories."""
+        graph = self.build_small_prop_graph({"rel1":ak.array(["a", "b", "a", "b"]),
+                                             "rel2":ak.array(["c", "c", "d", "c"])},
+                                            relationship_columns=["rel1", "rel2"])
+        graph.load_node_attributes(ak.DataFrame({"nodes":graph.nodes(),
+                                                 "lbl1":ak.array(["x", "y", "x", "y"]),
+                                                 "lbl2":ak.array(["z", "z", "z", "w"])}),
+                                   node_column="nodes", label_columns=["lbl1", "lbl2"])
+
+        expected = {"rel1":(["a", "b", "a", "b"], {"c", "d"}),
+                    "rel2":(["c", "c", "d", "c"], {"a", "b"})}
+        for col, (values, other_values) in expected.items():
+            categorical = graph.edge_attributes[col]
+            categories = set(categorical.categories.to_list())
+            self.assertIsInstance(categorical, ak.Categorical)
+            self.assertListEqual(categorical.to_list(), values)
+            self.assertTrue(set(values) <= categories)
+            self.assertFalse(other_values & categories)
+
+        expected = {"lbl1":(["x", "y", "x", "y"], {"z", "w"}),
+                    "lbl2":(["z", "z", "z", "w"], {"x", "y"})}
+        for col, (values, other_values) in expected.items():
+            categorical = graph.node_attributes[col]
+            categories = set(categorical.categories.to_list())
+            self.assertIsInstance(categorical, ak.Categorical)
+            self.assertListEqual(categorical.to_list(), values)
+            self.assertTrue(set(values) <= categories)
+            self.assertFalse(other_values & categories)
+
+    def test_assigned_attribute_columns(self):
+        """Tests that columns assigned to the attribute dataframes are kept when labels or
+        relationships are added and that columns of the wrong size are rejected."""
+        graph = self.build_small_prop_graph()
+        graph.load_node_attributes(ak.DataFrame({"nodes":graph.nodes()}), node_column="nodes")
+        src, dst = graph.edges()
+        nodes = graph.nodes()
+
+        graph.node_attributes["x"] = ak.array([1, 2, 3, 4])
+        graph.edge_attributes["y"] = ak.array([5, 6, 7, 8])
+        graph.add_node_labels(ak.DataFrame({"nodes":nodes, "lbl":ak.array(["a", "b", "a", "b"])}),
+                              "nodes")
+        graph.add_edge_relationships(ak.DataFrame({"src":src, "dst":dst,
+                                                   "rel":ak.array(["c", "d", "c", "d"])}),
+                                     "src", "dst")
+
+        self.assertListEqual(graph.node_attributes["x"].to_list(), [1, 2, 3, 4])
+        self.assertListEqual(graph.edge_attributes["y"].to_list(), [5, 6, 7, 8])
+        self.assertListEqual(graph.get_node_labels()["lbl"].to_list(), ["a", "b", "a", "b"])
+        with self.assertRaises(KeyError):
+            graph.add_node_labels(ak.DataFrame({"nodes":nodes, "x":nodes}), "nodes")
+        with self.assertRaises(KeyError):
+            graph.add_edge_relationships(ak.DataFrame({"src":src, "dst":dst, "y":src}),
+                                         "src", "dst")
+
+        with self.assertRaises(ValueError):
+            graph.add_node_labels(ak.DataFrame({"nodes":nodes[0:2],
+                                                "lbl2":ak.array(["a", "b"])}), "nodes")
+        with self.assertRaises(ValueError):
+            graph.add_edge_relationships(ak.DataFrame({"src":src[0:2], "dst":dst[0:2],
+                                                       "rel2":ak.array(["c", "d"])}),
+                                         "src", "dst")
+        self.assertNotIn("lbl2", graph.node_attributes.columns)
+        self.assertNotIn("rel2", graph.edge_attributes.columns)
+
+    def test_label_and_relationship_views(self):
+        """Tests that label and relationship getters expose only their own columns."""
+        graph,_ = self.build_prop_graph_and_networkx()
+        labels = graph.get_node_labels()
+        relationships = graph.get_edge_relationships()
+
+        self.assertListEqual(labels.columns, ["nodes", "data5", "data2"])
+        self.assertListEqual(relationships.columns, ["src", "dst", "data5", "data1"])
+        self.assertIsInstance(labels, ar.AttributeView)
+        self.assertListEqual(labels["data2"].to_list(), graph.node_attributes["data2"].to_list())
+        self.assertListEqual(labels[["nodes", "data2"]]["data2"].to_list(),
+                             graph.node_attributes["data2"].to_list())
+        with self.assertRaises(KeyError):
+            labels["data1"]
+        with self.assertRaises(KeyError):
+            labels[["nodes", "data1"]]
+        with self.assertRaises(TypeError):
+            labels[graph.node_attributes["data2"] == 0]
+
+    def test_reload_same_edges(self):
+        """Tests that reloading the same edges reuses the graph unless a reload is requested and
+        that the back-end graph holds the same attributes in both cases."""
+        graph = self.build_small_prop_graph({"w":ak.array([1, 2, 3, 4]),
+                                             "rel":ak.array(["a", "b", "a", "b"])},
+                                            relationship_columns="rel")
+        edges = dict(zip(("src", "dst"), graph.edges()))
+        graph.load_node_attributes(ak.DataFrame({"nodes":graph.nodes(),
+                                                 "lbl":ak.array(["x", "y", "x", "y"])}),
+                                   node_column="nodes", label_columns="lbl")
+        self.assertTrue(self.holds_attributes(graph,
+                                              edge_attributes={"w":ak.array([1]),
+                                                               "rel":ak.array(["a"])},
+                                              relationship_columns="rel",
+                                              node_attributes={"lbl":ak.array(["x", "y"])},
+                                              label_columns="lbl"))
+        name = graph.name
+
+        # Reusing the graph drops every attribute of the previous load, node attributes included.
+        graph.load_edge_attributes(ak.DataFrame({**edges, "w":ak.array([5, 6, 7, 8])}),
+                                   source_column="src", destination_column="dst")
+        self.assertEqual(graph.name, name)
+        self.assertListEqual(graph.edge_attributes["w"].to_list(), [5, 6, 7, 8])
+        self.assertListEqual(graph.relationship_columns, [])
+        self.assertListEqual(graph.label_columns, [])
+        self.assertTrue(self.holds_attributes(graph, edge_attributes={"w":ak.array([5])}))
+        self.assertFalse(self.holds_attributes(graph, edge_attributes={"w":ak.array([1])}))
+        self.assertFalse(self.holds_attributes(graph, edge_attributes={"rel":ak.array(["a"])},
+                                               relationship_columns="rel"))
+        self.assertFalse(self.holds_attributes(graph,
+                                               node_attributes={"lbl":ak.array(["x", "y"])},
+                                               label_columns="lbl"))
+
+        graph.load_edge_attributes(ak.DataFrame({**edges, "rel":ak.array(["a", "b", "a", "b"])}),
+                                   source_column="src", destination_column="dst",
+                                   relationship_columns="rel")
+        self.assertEqual(graph.name, name)
+        self.assertTrue(self.holds_attributes(graph, edge_attributes={"rel":ak.array(["a"])},
+                                              relationship_columns="rel"))
+        self.assertFalse(self.holds_attributes(graph, edge_attributes={"w":ak.array([5])}))
+
+        # Rebuilding the graph leaves the back-end in the same state as reusing it.
+        graph.load_node_attributes(ak.DataFrame({"nodes":graph.nodes(),
+                                                 "lbl":ak.array(["x", "y", "x", "y"])}),
+                                   node_column="nodes", label_columns="lbl")
+        graph.load_edge_attributes(ak.DataFrame({**edges, "w":ak.array([5, 6, 7, 8])}),
+                                   source_column="src", destination_column="dst",
+                                   reload_topology=True)
+        self.assertNotEqual(graph.name, name)
+        self.assertListEqual(graph.label_columns, [])
+        self.assertTrue(self.holds_attributes(graph, edge_attributes={"w":ak.array([5])}))
+        self.assertFalse(self.holds_attributes(graph,
+                                               node_attributes={"lbl":ak.array(["x", "y"])},
+                                               label_columns="lbl"))
+
+    def test_add_labels_and_relationships_twice(self):
+        """Tests that labels and relationships added in separate calls are all kept."""
+        graph = self.build_small_prop_graph()
+        src, dst = graph.edges()
+        nodes = graph.nodes()
+
+        graph.add_node_labels(ak.DataFrame({"nodes":nodes, "lbl1":ak.array(["x", "y", "x", "y"])}),
+                              "nodes")
+        graph.add_node_labels(ak.DataFrame({"nodes":nodes, "lbl2":ak.array(["z", "z", "w", "w"])}),
+                              "nodes")
+        graph.add_edge_relationships(ak.DataFrame({"src":src, "dst":dst,
+                                                   "rel1":ak.array(["a", "b", "a", "b"])}),
+                                     "src", "dst")
+        graph.add_edge_relationships(ak.DataFrame({"src":src, "dst":dst,
+                                                   "rel2":ak.array(["c", "c", "d", "d"])}),
+                                     "src", "dst")
+
+        self.assertListEqual(graph.label_columns, ["lbl1", "lbl2"])
+        self.assertListEqual(graph.relationship_columns, ["rel1", "rel2"])
+        self.assertTrue(self.holds_attributes(graph,
+                                              edge_attributes={"rel1":ak.array(["a"]),
+                                                               "rel2":ak.array(["c"])},
+                                              relationship_columns=["rel1", "rel2"],
+                                              node_attributes={"lbl1":ak.array(["x", "y"]),
+                                                               "lbl2":ak.array(["z", "z"])},
+                                              label_columns=["lbl1", "lbl2"]))
+
     def test_prop_graph_and_networkx_graph_equality(self):
         """Tests that property graph and network populate the same attributes."""
         prop_graph, nx_graph = self.build_prop_graph_and_networkx()
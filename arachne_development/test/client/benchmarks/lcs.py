@@ -8,53 +8,51 @@ import string
 import arachne_development.lcs as njit
 
 
-def time_ak_lcs( strlen1, strlen2,trials):
+def time_ak_lcs( strlen1, strlen2,trials, verbose=False):
 
-    print("before call")
-    stringsOne = ak.random_strings_uniform(minlen=strlen1-1, maxlen=strlen1, seed=1,\
-                  size= 1, characters="printable")
-    print(stringsOne.size)
-    print("after call")
-    print("trials=",trials)
-    stringsTwo = ak.random_strings_uniform(minlen=strlen2-1, maxlen=strlen2, seed=1, \
-                  size=1, characters="printable")
+    both = ak.random_strings_uniform(minlen=min(strlen1,strlen2)-1, maxlen=max(strlen1,strlen2),\
+                  seed=1, size=2, characters="printable")
+    stringsOne = both[0:1]
+    stringsTwo = both[1:2]
 
-    print("String one is ",stringsOne)
-    print("size of string 1 is ",stringsOne.size)
-    print("bytes of string 1 is ",stringsOne.nbytes)
-    print("ndim of string 1 is ", stringsOne.ndim)
-    print("shape of string 1 is", stringsOne.shape)
-    print("dtye of string 1 is ",stringsOne.dtype)
-    print(stringsTwo)
-    print(stringsTwo.size)
-    print(stringsTwo.nbytes)
-    print(stringsTwo.ndim)
-    print(stringsTwo.shape)
-    print(stringsTwo.dtype)
+    if verbose:
+        print("trials=",trials)
+        print("String one is ",stringsOne)
+        print("size of string 1 is ",stringsOne.size)
+        print("bytes of string 1 is ",stringsOne.nbytes)
+        print("ndim of string 1 is ", stringsOne.ndim)
+        print("shape of string 1 is", stringsOne.shape)
+        print("dtye of string 1 is ",stringsOne.dtype)
+        print(stringsTwo)
+        print(stringsTwo.size)
+        print(stringsTwo.nbytes)
+        print(stringsTwo.ndim)
+        print(stringsTwo.shape)
+        print(stringsTwo.dtype)
 
-    print("before lcs ")
-    timings = []
+    timings = np.empty(trials, dtype=np.int64)
     for i in range(trials):
-        print("test =",i)
-        start = time.time()
+        start = time.perf_counter_ns()
         c=njit.lcs(stringsOne,stringsTwo)
-        print("size=",c.size)
-        print("nbyte=",c.nbytes)
-        print("return results=",c)
-        end = time.time()
-        timings.append(end - start)
-    tavg = sum(timings) / trials
+        end = time.perf_counter_ns()
+        timings[i] = end - start
+    tmedian = np.median(timings) / 1e9
 
-    print("Average time = {:.4f} sec".format(tavg))
+    print("size=",c.size)
+    print("nbyte=",c.nbytes)
+    print("return results=",c)
+
+    print("Median time = {:.4f} sec".format(tmedian))
 
 
 def create_parser():
     parser = argparse.ArgumentParser(description="Measure the performance of suffix array building: C= suffix_array(V)")
     parser.add_argument('hostname', help='Hostname of arkouda server')
     parser.add_argument('port', type=int, help='Port of arkouda server')
-    parser.add_argument('--len1', default=10, help='length of string 1')
-    parser.add_argument('--len2', default=15, help='length of string 2')
+    parser.add_argument('--len1', type=int, default=10, help='length of string 1')
+    parser.add_argument('--len2', type=int, default=15, help='length of string 2')
     parser.add_argument('-t', '--trials', type=int, default=1, help='Number of times to run the benchmark')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Print the generated strings before timing')
     return parser
 
 
@@ -65,6 +63,6 @@ if __name__ == "__main__":
     args = parser.parse_args()
     ak.connect(args.hostname, args.port)
 
-    time_ak_lcs(args.len1, args.len2, args.trials)
+    time_ak_lcs(args.len1, args.len2, args.trials, args.verbose)
     ak.shutdown()
     sys.exit(0)